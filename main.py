@@ -1,19 +1,20 @@
 import streamlit as st
-import numpy as np
 import time
 import random
 import json
 import os
+from solver import find_conflict, generate_sudoku, to_bytes, to_rows
 
 # 🎨 Set page config
 st.set_page_config(page_title="🎯 Sudoku Master Pro", layout="wide")
 
 # ✅ Initialize session state
 def init_state():
+    # Boards live in session state as immutable 81-byte strings (index r * 9 + c)
     if "original_board" not in st.session_state:
-        st.session_state.original_board = np.zeros((9, 9), dtype=int)
+        st.session_state.original_board = bytes(81)
     if "board" not in st.session_state:
-        st.session_state.board = np.copy(st.session_state.original_board)
+        st.session_state.board = st.session_state.original_board
     if "start_time" not in st.session_state:
         st.session_state.start_time = time.time()
     if "hints_used" not in st.session_state:
@@ -28,60 +29,24 @@ def init_state():
 init_state()
 
 # 📁 Constants
-DIFFICULTY_LEVELS = {
-    "Easy": 35,
-    "Medium": 30,
-    "Hard": 25
-}
-
 LEADERBOARD_FILE = "leaderboard.json"
 
+PUZZLE_SEED_RANGE = 2**31
+
+# Per-cell widget keys and display strings, built once instead of per render
+CELL_KEYS = tuple(f"cell-{p // 9}-{p % 9}" for p in range(81))
+CELL_TEXT = ("",) + tuple(str(n) for n in range(1, 10))
+
 # 🧠 Sudoku Generator
-def generate_sudoku(difficulty="Easy"):
-    board = np.zeros((9, 9), dtype=int)
-    fill_diagonal_blocks(board)
-    solve(board)
-    solution = np.copy(board)
-    remove_cells(board, DIFFICULTY_LEVELS[difficulty])
-    return board, solution
-
-def fill_diagonal_blocks(board):
-    for i in range(0, 9, 3):
-        nums = random.sample(range(1, 10), 9)
-        for row in range(3):
-            for col in range(3):
-                board[i+row][i+col] = nums.pop()
-
-def solve(board):
-    for i in range(9):
-        for j in range(9):
-            if board[i][j] == 0:
-                for n in range(1, 10):
-                    if is_valid(board, i, j, n):
-                        board[i][j] = n
-                        if solve(board):
-                            return True
-                        board[i][j] = 0
-                return False
-    return True
-
-def is_valid(board, row, col, num):
-    block_row, block_col = row // 3 * 3, col // 3 * 3
-    return all([
-        num not in board[row, :],
-        num not in board[:, col],
-        num not in board[block_row:block_row+3, block_col:block_col+3]
-    ])
-
-def remove_cells(board, count):
-    removed = 0
-    while removed < 81 - count:
-        i, j = random.randint(0, 8), random.randint(0, 8)
-        if board[i][j] != 0:
-            board[i][j] = 0
-            removed += 1
+# Puzzles are memoized per (difficulty, seed); each new game draws a fresh seed,
+# so a cached puzzle is only reused when the same seed comes up again.
+@st.cache_data(max_entries=64)
+def cached_sudoku(difficulty, seed):
+    board, solution = generate_sudoku(difficulty, seed)
+    return to_bytes(board), to_bytes(solution)
 
 # 💾 Leaderboard
+@st.cache_data
 def load_leaderboard():
     if not os.path.exists(LEADERBOARD_FILE):
         return []
@@ -99,6 +64,7 @@ def save_score(name, score, time_taken, difficulty):
     leaderboard.sort(key=lambda x: (-x["score"], x["time"]))
     with open(LEADERBOARD_FILE, "w") as file:
         json.dump(leaderboard, file, indent=2)
+    load_leaderboard.clear()
 
 # 🎵 Music Toggle (Basic Sound)
 def audio_tag():
@@ -110,50 +76,71 @@ def audio_tag():
     st.markdown(audio_html, unsafe_allow_html=True)
 
 # 🔢 Sudoku Grid UI
+def set_cell(i, j, val):
+    cells = bytearray(st.session_state.board)
+    cells[i * 9 + j] = val
+    st.session_state.board = bytes(cells)
+
+# Keyed inputs keep their own state across reruns, so board changes made
+# outside the grid (undo, hint, reset, new game) are mirrored into them.
+def sync_input(p):
+    st.session_state[CELL_KEYS[p]] = CELL_TEXT[st.session_state.board[p]]
+
+def sync_inputs():
+    for p in range(81):
+        sync_input(p)
+
 def draw_board():
+    original, board = st.session_state.original_board, st.session_state.board
     for i in range(9):
         cols = st.columns(9)
         for j in range(9):
-            key = f"cell-{i}-{j}"
-            default_val = (
-                int(st.session_state.board[i][j])
-                if st.session_state.board[i][j] != 0
-                else ""
-            )
-            disabled = st.session_state.original_board[i][j] != 0
-            val = cols[j].text_input("", value=str(default_val), max_chars=1, key=key, disabled=disabled)
+            p = i * 9 + j
+            # Given cells can't change, so they render as plain markdown
+            # instead of paying for a disabled widget on every rerun.
+            if original[p] != 0:
+                cols[j].markdown(f"**{original[p]}**")
+                continue
+            if CELL_KEYS[p] not in st.session_state:
+                sync_input(p)
+            val = cols[j].text_input("", max_chars=1, key=CELL_KEYS[p])
             if val.isdigit():
                 val_int = int(val)
-                if 1 <= val_int <= 9:
-                    if not disabled:
-                        st.session_state.moves.append((i, j, st.session_state.board[i][j]))
-                        st.session_state.board[i][j] = val_int
+                # Only react to actual edits; an unchanged cell on a rerun is a no-op
+                if 1 <= val_int <= 9 and val_int != board[p]:
+                    st.session_state.moves.append((i, j, board[p]))
+                    set_cell(i, j, val_int)
 
 # 💡 Hint Generator
 def give_hint():
-    for i in range(9):
-        for j in range(9):
-            if st.session_state.board[i][j] == 0:
-                st.session_state.board[i][j] = st.session_state.solution[i][j]
-                st.session_state.hints_used += 1
-                st.success(f"Hint placed at ({i+1}, {j+1})")
-                return
+    p = st.session_state.board.find(0)
+    if p >= 0:
+        i, j = divmod(p, 9)
+        set_cell(i, j, st.session_state.solution[p])
+        sync_input(p)
+        st.session_state.hints_used += 1
+        st.success(f"Hint placed at ({i+1}, {j+1})")
 
 # 🔍 Validator
 def validate_board():
-    board = st.session_state.board
-    for i in range(9):
-        for j in range(9):
-            if board[i][j] != 0 and not is_valid(board, i, j, board[i][j]):
-                st.error(f"Invalid number at row {i+1}, column {j+1}")
-                return
+    conflict = find_conflict(to_rows(st.session_state.board))
+    if conflict:
+        i, j = conflict
+        st.error(f"Invalid number at row {i+1}, column {j+1}")
+        return
     st.success("Board looks valid so far!")
 
 # 🔄 Undo
 def undo_move():
     if st.session_state.moves:
         i, j, prev = st.session_state.moves.pop()
-        st.session_state.board[i][j] = prev
+        set_cell(i, j, prev)
+        sync_input(i * 9 + j)
+
+# 🔁 Reset
+def reset_board():
+    st.session_state.board = st.session_state.original_board
+    sync_inputs()
 
 # ⏱ Timer
 def show_timer():
@@ -166,14 +153,15 @@ def show_timer():
 st.sidebar.header("🧩 Sudoku Controls")
 difficulty = st.sidebar.selectbox("Select Difficulty", ["Easy", "Medium", "Hard"])
 if st.sidebar.button("🆕 Generate Puzzle"):
-    board, solution = generate_sudoku(difficulty)
-    st.session_state.original_board = np.copy(board)
-    st.session_state.board = np.copy(board)
+    board, solution = cached_sudoku(difficulty, random.randrange(PUZZLE_SEED_RANGE))
+    st.session_state.original_board = board
+    st.session_state.board = board
     st.session_state.solution = solution
     st.session_state.difficulty = difficulty
     st.session_state.start_time = time.time()
     st.session_state.hints_used = 0
     st.session_state.moves = []
+    sync_inputs()
 
 if st.sidebar.checkbox("🎵 Play Background Music"):
     audio_tag()
@@ -181,18 +169,19 @@ if st.sidebar.checkbox("🎵 Play Background Music"):
 draw_board()
 
 # Footer controls
+# Hint, Undo and Reset run as callbacks so they can update the cell inputs
+# before the grid is drawn on the next rerun.
 col1, col2, col3, col4, col5 = st.columns(5)
-if col1.button("💡 Hint"):
-    give_hint()
+col1.button("💡 Hint", on_click=give_hint)
 
 if col2.button("🔍 Validate"):
     validate_board()
 
-if col3.button("🔄 Undo"):
-    undo_move()
+col3.button("🔄 Undo", on_click=undo_move)
 
 if col4.button("✅ Submit"):
-    if np.array_equal(st.session_state.board, st.session_state.solution):
+    board = st.session_state.board
+    if b"\x00" not in board and board == st.session_state.solution:
         elapsed = show_timer()
         hints = st.session_state.hints_used
         score = max(1000 - elapsed - (hints * 50), 0)
@@ -203,8 +192,7 @@ if col4.button("✅ Submit"):
     else:
         st.error("❌ Incorrect solution. Try again!")
 
-if col5.button("🔁 Reset"):
-    st.session_state.board = np.copy(st.session_state.original_board)
+col5.button("🔁 Reset", on_click=reset_board)
 
 # Timer
 elapsed_time = show_timer()
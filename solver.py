@@ -0,0 +1,175 @@
+import functools
+import random
+from collections import Counter
+
+# NumPy and Numba are imported on first use rather than at module load, so
+# the app starts without paying for them until a puzzle is generated.
+@functools.lru_cache(maxsize=1)
+def _np():
+    import numpy as np
+    return np
+
+@functools.lru_cache(maxsize=1)
+def _numba_solver():
+    try:
+        from solver_numba import solve_board
+    except ImportError:
+        return None
+    return solve_board
+
+# 📁 Constants
+DIFFICULTY_LEVELS = {
+    "Easy": 35,
+    "Medium": 30,
+    "Hard": 25
+}
+
+# Row, column and box id of each flat cell index, and the 20 cells sharing a
+# row, column or box with it
+ROW_OF = bytes(p // 9 for p in range(81))
+COL_OF = bytes(p % 9 for p in range(81))
+BOX_OF = bytes((r // 3) * 3 + c // 3 for r in range(9) for c in range(9))
+PEERS = tuple(
+    frozenset(
+        p for p in range(81)
+        if p != i and (ROW_OF[p] == ROW_OF[i] or COL_OF[p] == COL_OF[i] or BOX_OF[p] == BOX_OF[i])
+    )
+    for i in range(81)
+)
+
+# 🧠 Sudoku Generator
+def generate_sudoku(difficulty="Easy", seed=None):
+    rng = random.Random(seed)
+    np = _np()
+    board = np.zeros((9, 9), dtype=int)
+    fill_diagonal_blocks(board, rng)
+    solve(board, random_order(rng))
+    solution = np.copy(board)
+    remove_cells(board, DIFFICULTY_LEVELS[difficulty], rng)
+    return board, solution
+
+def fill_diagonal_blocks(board, rng=random):
+    for i in range(0, 9, 3):
+        nums = rng.sample(range(1, 10), 9)
+        for row in range(3):
+            for col in range(3):
+                board[i+row][i+col] = nums.pop()
+
+# Candidate orderings for solve(): fixed for solving, shuffled for generation
+def in_order(row, col):
+    return range(1, 10)
+
+def random_order(rng=random):
+    return lambda row, col: rng.sample(range(1, 10), 9)
+
+def solve(board, order=in_order):
+    # Solver state is flat: cell values in a bytearray indexed r * 9 + c,
+    # plus one 9-bit mask per row, column and box.
+    cells = bytearray(int(board[i][j]) for i in range(9) for j in range(9))
+    row_mask, col_mask, box_mask = [0] * 9, [0] * 9, [0] * 9
+    for p, val in enumerate(cells):
+        if val != 0:
+            bit = 1 << (val - 1)
+            row_mask[ROW_OF[p]] |= bit
+            col_mask[COL_OF[p]] |= bit
+            box_mask[BOX_OF[p]] |= bit
+    solve_numba = _numba_solver()
+    if solve_numba is not None:
+        return solve_numba(board, row_mask, col_mask, box_mask, order)
+    candidates = [0] * 81
+    for p in range(81):
+        if cells[p] == 0:
+            candidates[p] = ~(row_mask[ROW_OF[p]] | col_mask[COL_OF[p]] | box_mask[BOX_OF[p]]) & 0x1FF
+    if not _solve(cells, candidates, order):
+        return False
+    board[:] = to_rows(cells)
+    return True
+
+def to_rows(cells):
+    return [list(cells[r * 9:r * 9 + 9]) for r in range(9)]
+
+def to_bytes(board):
+    return bytes(int(val) for row in board for val in row)
+
+# Backtracking with forward checking: placing a digit strikes it from every
+# empty peer's candidates and fails as soon as one of them runs out. Frames
+# live on an explicit stack as [cell, untried digits, placed bit, struck peers]
+# instead of in Python call frames.
+def _solve(cells, candidates, order):
+    stack = []
+    p = find_empty(cells, candidates)
+    while p is not None:
+        stack.append([p, iter(order(ROW_OF[p], COL_OF[p])), 0, None])
+        while stack:
+            frame = stack[-1]
+            p, digits, bit, trail = frame
+            if bit:
+                for q in trail:
+                    candidates[q] |= bit
+                cells[p] = 0
+            trail = None
+            for n in digits:
+                bit = 1 << (n - 1)
+                if candidates[p] & bit:
+                    trail = _assign(cells, candidates, p, n, bit)
+                    if trail is not None:
+                        break
+            if trail is None:
+                stack.pop()
+                continue
+            frame[2], frame[3] = bit, trail
+            break
+        else:
+            return False
+        p = find_empty(cells, candidates)
+    return True
+
+# Place n at p and return the peers it was struck from, or undo and return
+# None if that leaves a peer without candidates.
+def _assign(cells, candidates, p, n, bit):
+    cells[p] = n
+    trail = []
+    for q in PEERS[p]:
+        if cells[q] == 0 and candidates[q] & bit:
+            candidates[q] ^= bit
+            trail.append(q)
+            if candidates[q] == 0:
+                for q in trail:
+                    candidates[q] |= bit
+                cells[p] = 0
+                return None
+    return trail
+
+# Empty cell with the fewest remaining candidates (MRV)
+def find_empty(cells, candidates):
+    best, best_count = None, 10
+    p = cells.find(0)
+    while p >= 0:
+        count = bin(candidates[p]).count("1")
+        if count < best_count:
+            best, best_count = p, count
+            if count <= 1:
+                return best
+        p = cells.find(0, p + 1)
+    return best
+
+def remove_cells(board, count, rng=random):
+    for p in rng.sample(range(81), 81 - count):
+        board[p // 9][p % 9] = 0
+
+# 🔍 Validator
+def find_conflict(board):
+    row_ct = [Counter(board[i][j] for j in range(9)) for i in range(9)]
+    col_ct = [Counter(board[i][j] for i in range(9)) for j in range(9)]
+    box_ct = [
+        Counter(board[b // 3 * 3 + i][b % 3 * 3 + j] for i in range(3) for j in range(3))
+        for b in range(9)
+    ]
+    for i in range(9):
+        for j in range(9):
+            val = board[i][j]
+            if val != 0 and (
+                row_ct[i][val] > 1 or col_ct[j][val] > 1 or box_ct[i // 3 * 3 + j // 3][val] > 1
+            ):
+                return i, j
+    return None
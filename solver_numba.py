@@ -0,0 +1,64 @@
+import numpy as np
+from numba import njit
+
+# Row, column and box id of each flat cell index; Numba freezes these
+# module-level arrays into the compiled kernel as constants.
+ROW_OF = np.array([p // 9 for p in range(81)], dtype=np.int8)
+COL_OF = np.array([p % 9 for p in range(81)], dtype=np.int8)
+BOX_OF = np.array([(p // 27) * 3 + (p % 9) // 3 for p in range(81)], dtype=np.int8)
+
+# 🚀 JIT-compiled backtracking on an int8 board with int16 row/col/box bitmasks.
+# order[p] lists the digits to try for flat cell p, so the same kernel serves
+# both solving (1..9) and randomized generation. Recursion is unrolled into
+# tried[d], the next order index for the d-th empty cell.
+@njit(cache=True)
+def solve_nb(board, rm, cm, bm, order):
+    empties = np.empty(81, dtype=np.int64)
+    n_empty = 0
+    for p in range(81):
+        if board[ROW_OF[p], COL_OF[p]] == 0:
+            empties[n_empty] = p
+            n_empty += 1
+    tried = np.zeros(81, dtype=np.int64)
+    d = 0
+    while 0 <= d < n_empty:
+        p = empties[d]
+        r, c, b = ROW_OF[p], COL_OF[p], BOX_OF[p]
+        if board[r, c] != 0:
+            bit = 1 << (board[r, c] - 1)
+            board[r, c] = 0
+            rm[r] ^= bit
+            cm[c] ^= bit
+            bm[b] ^= bit
+        used = rm[r] | cm[c] | bm[b]
+        placed = False
+        while tried[d] < 9:
+            n = order[p, tried[d]]
+            tried[d] += 1
+            bit = 1 << (n - 1)
+            if not used & bit:
+                board[r, c] = n
+                rm[r] |= bit
+                cm[c] |= bit
+                bm[b] |= bit
+                placed = True
+                break
+        if placed:
+            d += 1
+        else:
+            tried[d] = 0
+            d -= 1
+    return d == n_empty
+
+def solve_board(board, row_mask, col_mask, box_mask, order):
+    cells = np.asarray(board, dtype=np.int8)
+    solved = solve_nb(
+        cells,
+        np.array(row_mask, dtype=np.int16),
+        np.array(col_mask, dtype=np.int16),
+        np.array(box_mask, dtype=np.int16),
+        np.array([list(order(p // 9, p % 9)) for p in range(81)], dtype=np.int8),
+    )
+    if solved:
+        board[:] = cells.tolist()
+    return solved